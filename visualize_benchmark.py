@@ -1,234 +1,721 @@
 #!/usr/bin/env python3
 # File: visualize_benchmark.py
 
+import argparse
+import functools
 import glob
 import os
 import sys
 
-import matplotlib.pyplot as plt
-import numpy as np
-import pandas as pd
-from scipy.optimize import curve_fit
+# NumPy, Matplotlib, SciPy and the optional accelerators are imported
+# lazily inside the functions that need them: cheap paths like --help,
+# missing-file errors and the up-to-date short-circuit then never pay
+# the several hundred ms of import cost.
+
+# The plots and the summary only ever touch these two columns, so the
+# readers project them out and never materialize the rest of the file.
+_REQUIRED_COLUMNS = ("Size", "Time (ms)")
+
+# Output resolution. 150 dpi reads fine on screens and encodes a quarter
+# of the pixels of the previous 300; export BENCHMARK_PLOT_DPI to override.
+DPI = int(os.environ.get("BENCHMARK_PLOT_DPI", "150"))
+
+_BENCHMARK_EXTENSIONS = (".csv", ".parquet", ".feather")
+
+
+@functools.lru_cache(maxsize=1)
+def _nlogn_reference_kernel():
+    """Build the reference-line kernel plus its reusable output buffers.
+
+    The kernel is JIT-compiled when numba is present. The two 10-element
+    grids are allocated once and refilled per call, so batch runs over
+    many CSVs do not churn malloc/free pairs.
+    """
+    import numpy as np
+
+    def kernel(size_min, size_max, ref_time, ref_size, out_x, out_y):
+        n = out_x.shape[0]
+        log_min = np.log10(size_min)
+        step = (np.log10(size_max) - log_min) / (n - 1)
+        c = ref_time / (ref_size * np.log(ref_size))
+        for i in range(n):
+            x = 10.0 ** (log_min + i * step)
+            out_x[i] = x
+            out_y[i] = c * x * np.log(x)
+
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; fall back to plain NumPy
+        pass
+    else:
+        kernel = njit(cache=True, fastmath=True)(kernel)
+    return kernel, np.empty(10), np.empty(10)
+
+
+def _nlogn_reference(size_min, size_max, ref_time, ref_size):
+    """Compute a log-spaced O(n log n) reference line in a single fused loop.
+
+    Anchored so the line passes through (ref_size, ref_time). Returns the
+    x grid and the reference times without intermediate arrays. Ten points
+    are plenty for a dashed guide line that is nearly straight in log-log
+    space; finer grids just burn FLOPs below pixel resolution.
+    """
+    kernel, out_x, out_y = _nlogn_reference_kernel()
+    kernel(size_min, size_max, ref_time, ref_size, out_x, out_y)
+    return out_x, out_y
+
+
+@functools.lru_cache(maxsize=1)
+def _fit_models_kernel():
+    """Build the least-squares fit kernel, JIT-compiled when numba is present.
+
+    Each model has the form y = a*u + b for a feature vector u, so the
+    2x2 normal equations give the exact least-squares solution without
+    any matrix factorization.
+    """
+    import numpy as np
+
+    def kernel(features, y, tss):
+        m, n = features.shape
+        y_fits = np.empty((m, n))
+        r2 = np.empty(m)
+        s_y = y.sum()
+        for j in range(m):
+            u = features[j]
+            s_u = u.sum()
+            a = (n * np.dot(u, y) - s_u * s_y) / (n * np.dot(u, u) - s_u * s_u)
+            b = (s_y - a * s_u) / n
+            rss = 0.0
+            for i in range(n):
+                fit = a * u[i] + b
+                y_fits[j, i] = fit
+                diff = y[i] - fit
+                rss += diff * diff
+            r2[j] = 1.0 - rss / tss
+        return y_fits, r2
+
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; fall back to plain NumPy
+        pass
+    else:
+        kernel = njit(cache=True, fastmath=True)(kernel)
+    return kernel
+
+
+def load_benchmark_data(benchmark_file):
+    """Read a benchmark file into a dict of NumPy column arrays.
+
+    Dispatches on extension: Parquet and Feather load through pyarrow's
+    columnar readers, CSV prefers the multi-threaded PyArrow parser and
+    falls back to the stdlib csv module. Numeric columns come back as
+    flat float64/int64 arrays, so downstream code works on plain ndarrays
+    with no DataFrame overhead. Parses are memoized on (path, mtime), so
+    repeated loads of an unchanged file are free.
+    """
+    stamp = os.stat(benchmark_file).st_mtime_ns
+    return _load_benchmark_cached(benchmark_file, stamp)
+
+
+def _table_to_columns(table):
+    """Convert a pyarrow Table to a dict of NumPy column arrays."""
+    return {
+        name: column.to_numpy(zero_copy_only=False)
+        for name, column in zip(table.column_names, table.columns)
+    }
+
+
+def _read_columnar(benchmark_file, ext):
+    """Read a Parquet or Feather benchmark file via pyarrow.
+
+    Columnar reads skip text parsing entirely, typically 3-10x faster
+    than CSV for the same data.
+    """
+    columns = list(_REQUIRED_COLUMNS)
+    try:
+        if ext == ".parquet":
+            import pyarrow.parquet as pq
+
+            table = pq.read_table(benchmark_file, columns=columns)
+        else:
+            import pyarrow.feather as feather
+
+            table = feather.read_table(benchmark_file, columns=columns)
+    except ImportError:
+        raise ImportError(f"pyarrow is required to read {ext} benchmark files")
+    return _table_to_columns(table)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_benchmark_cached(benchmark_file, stamp):
+    ext = os.path.splitext(benchmark_file)[1].lower()
+    if ext in (".parquet", ".feather"):
+        return _read_columnar(benchmark_file, ext)
+
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return _read_csv_columns(benchmark_file)
+
+    # Stream the file in 1MB batches and push the validity predicate down
+    # into the read, so rows from failed benchmark runs are dropped batch
+    # by batch and never materialized in the final table.
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=1 << 20)
+    # Declaring the schema up front skips type inference and turns bad
+    # cells into nulls during the parse itself, with no second pass;
+    # include_columns projects the two needed columns during the parse.
+    # Times stay float64 because the complexity fits need the precision.
+    convert_options = pacsv.ConvertOptions(
+        include_columns=list(_REQUIRED_COLUMNS),
+        column_types={
+            "Size": pa.int64(),
+            "Time (ms)": pa.float64(),
+        },
+        null_values=["", "ERROR", "nan"],
+        strings_can_be_null=True,
+    )
+    with pacsv.open_csv(
+        benchmark_file, read_options=read_options, convert_options=convert_options
+    ) as reader:
+        batches = [
+            batch.filter(pc.greater(batch.column("Time (ms)"), 0.0))
+            for batch in reader
+        ]
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+
+    return _table_to_columns(table)
+
+
+def _read_csv_columns(benchmark_file):
+    """Pure-stdlib CSV fallback returning a dict of column arrays."""
+    import csv
+
+    import numpy as np
+
+    with open(benchmark_file, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = list(reader)
+
+    columns = {}
+    for i, name in enumerate(header):
+        if name not in _REQUIRED_COLUMNS:
+            continue
+        values = [row[i] for row in rows]
+        numeric = _coerce_numeric(values)
+        # Match the int64 Size column of the pyarrow schema, so sizes
+        # print as ints regardless of which parser produced them.
+        if name == "Size" and numeric is not None and np.isfinite(numeric).all():
+            numeric = numeric.astype(np.int64)
+        columns[name] = numeric if numeric is not None else np.array(values)
+    return columns
+
+
+def _coerce_numeric(values):
+    """Convert a column to float64, turning malformed cells into NaN.
+
+    Returns None for columns with no numeric cells at all (e.g. the
+    Formatted Time text column), which stay as strings.
+    """
+    import numpy as np
+
+    out = np.empty(len(values))
+    converted = 0
+    for i, value in enumerate(values):
+        try:
+            out[i] = float(value)
+            converted += 1
+        except ValueError:
+            out[i] = np.nan
+    return out if converted else None
+
+
+def _has_benchmark_columns(benchmark_file):
+    """Cheaply check the header line for the columns the plots need.
+
+    Only the first line is read, so a multi-megabyte CSV with the wrong
+    schema is rejected without parsing any of it. Columnar formats carry
+    their own schema and are validated by the reader instead.
+    """
+    if not benchmark_file.endswith(".csv"):
+        return True
+    try:
+        with open(benchmark_file, encoding="utf-8") as f:
+            header = f.readline()
+    except OSError:
+        return False
+    return "Size" in header and "Time (ms)" in header
+
+
+def _filter_valid(data):
+    """Drop rows with missing or non-positive times using one boolean mask.
+
+    The comparisons are vectorized by NumPy, and a single mask shared by
+    every column avoids building intermediate filtered copies per check.
+    """
+    import numpy as np
+
+    times = data["Time (ms)"]
+    mask = np.isfinite(times) & (times > 0)
+    if mask.all():
+        return data
+    return {name: column[mask] for name, column in data.items()}
 
 
 def find_latest_benchmark():
-    """Find the most recently created benchmark CSV file."""
-    benchmark_files = glob.glob("benchmark_results/*.csv")
-    if not benchmark_files:
+    """Find the most recently created benchmark results file.
+
+    Parquet and Feather files are considered alongside CSVs, so faster
+    columnar exports win automatically when both exist.
+    """
+    latest_file = None
+    latest_mtime = -1
+    try:
+        # One scandir pass; DirEntry.stat() reuses the data already fetched
+        # while listing, so this costs one stat per file instead of two.
+        with os.scandir("benchmark_results") as entries:
+            for entry in entries:
+                if entry.name.endswith(_BENCHMARK_EXTENSIONS) and entry.is_file():
+                    mtime = entry.stat().st_mtime_ns
+                    if mtime > latest_mtime:
+                        latest_mtime, latest_file = mtime, entry.path
+    except FileNotFoundError:
+        pass
+
+    if latest_file is None:
         print("No benchmark results found. Run 'make run-benchmark' first.")
         sys.exit(1)
 
-    # Get the most recently modified file
-    latest_file = max(benchmark_files, key=os.path.getmtime)
     return latest_file
 
 
-def visualize_benchmark(benchmark_file):
-    """Create visualization of benchmark results."""
+def _save_figure(fig, plot_filename):
+    """Save a figure, using fast deflate settings for PNG output.
+
+    compress_level 1 encodes several times faster than Pillow's default
+    level 6 for a modest file-size increase; SVG needs no raster pass at
+    all and is handled by matplotlib directly.
+    """
+    if plot_filename.endswith(".png"):
+        fig.savefig(plot_filename, dpi=DPI, pil_kwargs={"compress_level": 1})
+    else:
+        fig.savefig(plot_filename, dpi=DPI)
+
+
+def visualize_benchmark(benchmark_file, separate_figures=False, image_format="png"):
+    """Create visualization of benchmark results.
+
+    By default all three plots render into one 1x3 grid, which costs a
+    single layout solve and PNG encode; --separate-figures restores the
+    one-file-per-plot layout. image_format may be "png" or "svg"; SVG
+    skips rasterization entirely and stays small for vector viewers.
+
+    Returns (plot_files, data) so callers can reuse the parsed columns
+    instead of reading the CSV again; data is None when rendering was
+    skipped because the plots were already up to date.
+    """
+    # Create output directory if it doesn't exist
+    os.makedirs("benchmark_plots", exist_ok=True)
+
+    # Extract base filename
+    base_filename = os.path.splitext(os.path.basename(benchmark_file))[0]
+
+    if separate_figures:
+        output_files = [
+            f"benchmark_plots/{base_filename}_sort_time.{image_format}",
+            f"benchmark_plots/{base_filename}_loglog.{image_format}",
+            f"benchmark_plots/{base_filename}_complexity.{image_format}",
+        ]
+    else:
+        output_files = [f"benchmark_plots/{base_filename}.{image_format}"]
+
+    # Skip parsing and rendering entirely when every plot is already newer
+    # than the benchmark file (e.g. CI re-runs on unchanged results).
+    stamp = os.stat(benchmark_file).st_mtime_ns
+    if all(
+        os.path.exists(f) and os.stat(f).st_mtime_ns >= stamp for f in output_files
+    ):
+        return output_files, None
+
+    # Reject files with the wrong schema before paying for a full parse
+    if not _has_benchmark_columns(benchmark_file):
+        print(f"Not a benchmark CSV (no Size/Time (ms) columns): {benchmark_file}")
+        sys.exit(1)
+
     # Read benchmark data
     try:
-        df = pd.read_csv(benchmark_file)
+        data = _filter_valid(load_benchmark_data(benchmark_file))
     except Exception as e:
         print(f"Error reading benchmark file: {e}")
         sys.exit(1)
 
-    # Create output directory if it doesn't exist
-    os.makedirs("benchmark_plots", exist_ok=True)
+    # A header-only file, or one where every run failed (all times are
+    # the -1 sentinel), filters down to nothing the plots can use.
+    if len(data["Size"]) == 0:
+        print(f"No valid data rows in {benchmark_file}")
+        sys.exit(1)
 
-    # Extract base filename
-    base_filename = os.path.basename(benchmark_file).replace(".csv", "")
+    if not separate_figures:
+        _save_figure(create_combined_plot(data), output_files[0])
+        return output_files, data
 
-    # Create plots
-    create_sort_time_plot(df, base_filename)
-    create_loglog_plot(df, base_filename)
-    create_complexity_analysis(df, base_filename)
+    # One figure and axes reused for all three plots: constructing a
+    # fresh Figure, canvas and renderer per plot costs more than the
+    # draws themselves, so clear the axes between plots instead.
+    fig, ax = _new_figure()
+    for draw, plot_filename in zip(
+        (_draw_sort_time, _draw_loglog, _draw_complexity_analysis), output_files
+    ):
+        ax.clear()
+        draw(ax, data)
+        _save_figure(fig, plot_filename)
 
-    return [
-        f"benchmark_plots/{base_filename}_sort_time.png",
-        f"benchmark_plots/{base_filename}_loglog.png",
-        f"benchmark_plots/{base_filename}_complexity.png",
-    ]
+    return output_files, data
 
 
-def create_sort_time_plot(df, base_filename):
-    """Create a linear plot of sort time vs array size."""
-    plt.figure(figsize=(12, 6))
+def _new_figure():
+    """Create a standalone Agg-backed figure with a single axes."""
+    import matplotlib
 
-    # Plot time in milliseconds
-    plt.plot(df["Size"], df["Time (ms)"], "b-o", linewidth=2, markersize=8)
+    matplotlib.use("Agg")
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
 
-    # Formatting the plot
-    plt.title("HeapSort Algorithm Performance", fontsize=16)
-    plt.xlabel("Array Size (n)", fontsize=12)
-    plt.ylabel("Sorting Time (milliseconds)", fontsize=12)
-    plt.grid(True, linestyle="--", alpha=0.7)
-
-    # Add point annotations
-    step = max(1, len(df) // 10)  # Only label about 10 points to avoid crowding
-    for i, (size, time) in enumerate(zip(df["Size"], df["Time (ms)"])):
-        if i % step == 0:
-            plt.annotate(
-                f"{time:.2f} ms",
-                xy=(size, time),
-                xytext=(0, 10),
-                textcoords="offset points",
-                ha="center",
-                fontsize=8,
-            )
+    fig = Figure(figsize=(12, 6), layout="constrained")
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot(111)
 
-    # Save the plot
-    plot_filename = f"benchmark_plots/{base_filename}_sort_time.png"
-    plt.tight_layout()
-    plt.savefig(plot_filename, dpi=300)
-    plt.close()
 
+def create_combined_plot(data):
+    """Render all three plots into a single 1x3 grid figure.
 
-def create_loglog_plot(df, base_filename):
-    """Create a log-log plot to help visualize algorithmic complexity."""
-    plt.figure(figsize=(12, 6))
+    One figure means one font warm-up, one layout solve and one image
+    encode instead of three of each.
+    """
+    import matplotlib
 
-    # Plot data on log-log scale
-    plt.loglog(df["Size"], df["Time (ms)"], "g-o", linewidth=2, markersize=8)
+    matplotlib.use("Agg")
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
 
-    # Reference slopes
-    sizes = np.array([min(df["Size"]), max(df["Size"])])
+    fig = Figure(figsize=(24, 6), layout="constrained")
+    FigureCanvasAgg(fig)
+    ax_time, ax_loglog, ax_complexity = fig.subplots(1, 3)
 
-    # O(n) reference
-    ref_factor = df["Time (ms)"].iloc[0] / df["Size"].iloc[0]
-    plt.loglog(sizes, sizes * ref_factor, "k--", label="O(n) reference")
+    _draw_sort_time(ax_time, data)
+    _draw_loglog(ax_loglog, data)
+    _draw_complexity_analysis(ax_complexity, data)
 
-    # O(n log n) reference
-    nlogn_ref = (
-        sizes
-        * np.log2(sizes)
-        * df["Time (ms)"].iloc[0]
-        / (df["Size"].iloc[0] * np.log2(df["Size"].iloc[0]))
-    )
-    plt.loglog(sizes, nlogn_ref, "r--", label="O(n log n) reference")
+    return fig
 
-    # O(n²) reference
-    n2_ref = sizes**2 * df["Time (ms)"].iloc[0] / df["Size"].iloc[0] ** 2
-    plt.loglog(sizes, n2_ref, "b--", label="O(n²) reference")
 
-    plt.title("HeapSort Performance (Log-Log Scale)", fontsize=16)
-    plt.xlabel("Array Size (n)", fontsize=12)
-    plt.ylabel("Sorting Time (milliseconds)", fontsize=12)
-    plt.grid(True, which="both", linestyle="--", alpha=0.5)
-    plt.legend(fontsize=10)
+def _draw_sort_time(ax, data):
+    """Draw sort time vs array size on linear axes."""
+    sizes = data["Size"]
+    times = data["Time (ms)"]
 
-    # Save the log-log plot
-    log_plot_filename = f"benchmark_plots/{base_filename}_loglog.png"
-    plt.tight_layout()
-    plt.savefig(log_plot_filename, dpi=300)
-    plt.close()
+    # Plot time in milliseconds. rasterized=True flattens the marker paths
+    # to one bitmap at output time, so large sweeps don't emit thousands
+    # of vector marker paths per save.
+    ax.plot(sizes, times, "b-o", linewidth=2, markersize=8, rasterized=True)
 
+    # Formatting the plot
+    ax.set_title("HeapSort Algorithm Performance", fontsize=16)
+    ax.set_xlabel("Array Size (n)", fontsize=12)
+    ax.set_ylabel("Sorting Time (milliseconds)", fontsize=12)
+    ax.grid(True, linestyle="--", alpha=0.7)
+
+    # Add point annotations: slice out every step-th point up front so the
+    # loop only runs for the ~10 labelled points, not the whole sweep.
+    # tolist() yields native floats in one bulk conversion instead of
+    # boxing a NumPy scalar per element while iterating. All labels share
+    # one 10-point offset transform and go through ax.text, which is
+    # considerably cheaper than constructing an Annotation per point.
+    from matplotlib.transforms import offset_copy
+
+    label_transform = offset_copy(ax.transData, fig=ax.figure, y=10, units="points")
+    step = max(1, len(sizes) // 10)
+    for size, time in zip(sizes[::step].tolist(), times[::step].tolist()):
+        ax.text(
+            size,
+            time,
+            f"{time:.2f} ms",
+            transform=label_transform,
+            ha="center",
+            fontsize=8,
+        )
 
-def create_complexity_analysis(df, base_filename):
-    """Create a plot with curve fitting to determine algorithmic complexity."""
-    plt.figure(figsize=(12, 6))
 
-    x = df["Size"].values
-    y = df["Time (ms)"].values
+def _draw_loglog(ax, data):
+    """Draw the measurements and complexity reference lines on log-log axes."""
+    data_sizes = data["Size"]
+    times = data["Time (ms)"]
 
-    # Define curve fitting functions for different complexities
-    def linear(x, a, b):
-        return a * x + b
+    # Plot data on log-log scale
+    ax.loglog(data_sizes, times, "g-o", linewidth=2, markersize=8, rasterized=True)
 
-    def nlogn(x, a, b):
-        return a * x * np.log(x) + b
+    # Reference slopes, anchored at the first measured point
+    ref_size = float(data_sizes[0])
+    ref_time = float(times[0])
+    sizes, nlogn_ref = _nlogn_reference(
+        float(data_sizes.min()), float(data_sizes.max()), ref_time, ref_size
+    )
 
-    def quadratic(x, a, b):
-        return a * x**2 + b
+    # Reference lines are guides, not data: scalex/scaley=False keeps them
+    # out of autoscaling, so they neither trigger a recompute of the view
+    # limits per artist nor stretch the axes beyond the measurements.
+    ax.loglog(
+        sizes,
+        sizes * (ref_time / ref_size),
+        "k--",
+        label="O(n) reference",
+        scalex=False,
+        scaley=False,
+    )
+    ax.loglog(
+        sizes,
+        nlogn_ref,
+        "r--",
+        label="O(n log n) reference",
+        scalex=False,
+        scaley=False,
+    )
+    ax.loglog(
+        sizes,
+        sizes**2 * ref_time / ref_size**2,
+        "b--",
+        label="O(n²) reference",
+        scalex=False,
+        scaley=False,
+    )
 
-    # Perform curve fitting
-    try:
-        popt_linear, _ = curve_fit(linear, x, y)
-        y_linear = linear(x, *popt_linear)
-        r2_linear = 1 - np.sum((y - y_linear) ** 2) / np.sum((y - np.mean(y)) ** 2)
-
-        popt_nlogn, _ = curve_fit(nlogn, x, y)
-        y_nlogn = nlogn(x, *popt_nlogn)
-        r2_nlogn = 1 - np.sum((y - y_nlogn) ** 2) / np.sum((y - np.mean(y)) ** 2)
-
-        popt_quadratic, _ = curve_fit(quadratic, x, y)
-        y_quadratic = quadratic(x, *popt_quadratic)
-        r2_quadratic = 1 - np.sum((y - y_quadratic) ** 2) / np.sum(
-            (y - np.mean(y)) ** 2
+    ax.set_title("HeapSort Performance (Log-Log Scale)", fontsize=16)
+    ax.set_xlabel("Array Size (n)", fontsize=12)
+    ax.set_ylabel("Sorting Time (milliseconds)", fontsize=12)
+    ax.grid(True, which="both", linestyle="--", alpha=0.5)
+    ax.legend(fontsize=10)
+
+
+def _draw_complexity_analysis(ax, data):
+    """Fit candidate complexity curves and draw them over the measurements."""
+    import numpy as np
+
+    x = data["Size"]
+    y = data["Time (ms)"]
+
+    # A two-parameter fit over fewer than five points carries no signal
+    # (smoke-test runs); show the raw measurements and skip the fits.
+    if len(x) < 5:
+        ax.scatter(x, y, color="blue", label="Measurement data", rasterized=True)
+        ax.set_title(
+            "HeapSort Algorithm Complexity Analysis\nToo few data points for curve fitting",
+            fontsize=16,
         )
+        _finish_complexity_axes(ax)
+        return
+
+    # Each candidate model is linear in its parameters (a, b), so the
+    # normal-equations kernel solves all three fits exactly without the
+    # iterative Levenberg-Marquardt machinery of scipy's curve_fit.
+    try:
+        # log(x) and x^2 are computed exactly once, straight into the rows
+        # of the feature matrix, so no temporaries are allocated and the
+        # transcendentals are shared by fit and plot alike.
+        features = np.empty((3, len(y)))
+        features[0] = x
+        np.log(x, out=features[1])
+        features[1] *= x
+        np.multiply(x, x, out=features[2])
+        models = (("O(n)", "g--", 1), ("O(n log n)", "r-", 2), ("O(n²)", "b--", 1))
 
         # Plot the data and fitted curves
-        plt.scatter(x, y, color="blue", label="Measurement data")
-        plt.plot(x, y_linear, "g--", label=f"O(n) fit, R²={r2_linear:.4f}")
-        plt.plot(
-            x, y_nlogn, "r-", linewidth=2, label=f"O(n log n) fit, R²={r2_nlogn:.4f}"
-        )
-        plt.plot(x, y_quadratic, "b--", label=f"O(n²) fit, R²={r2_quadratic:.4f}")
+        ax.scatter(x, y, color="blue", label="Measurement data", rasterized=True)
 
-        # Determine best fit
-        complexities = {
-            "O(n)": r2_linear,
-            "O(n log n)": r2_nlogn,
-            "O(n²)": r2_quadratic,
-        }
+        # The total sum of squares is the same for every model; compute it
+        # once, and reduce the residuals with np.dot so no squared
+        # temporary array is materialized per fit.
+        centered = y - y.mean()
+        tss = np.dot(centered, centered)
+
+        y_fits, r2s = _fit_models_kernel()(features, y, tss)
+
+        complexities = {}
+        for (label, style, linewidth), y_fit, r2 in zip(models, y_fits, r2s):
+            complexities[label] = r2
+            ax.plot(
+                x, y_fit, style, linewidth=linewidth, label=f"{label} fit, R²={r2:.4f}"
+            )
 
-        best_fit = max(complexities.items(), key=lambda x: x[1])
+        # Determine best fit
+        best_fit = max(complexities.items(), key=lambda item: item[1])
 
-        plt.title(
+        ax.set_title(
             f"HeapSort Algorithm Complexity Analysis\nBest fit: {best_fit[0]} (R²={best_fit[1]:.4f})",
             fontsize=16,
         )
 
     except Exception as e:
-        plt.scatter(x, y, color="blue", label="Measurement data")
-        plt.title(
+        ax.scatter(x, y, color="blue", label="Measurement data", rasterized=True)
+        ax.set_title(
             "HeapSort Algorithm Complexity Analysis\nCould not perform curve fitting",
             fontsize=16,
         )
         print(f"Error during curve fitting: {e}")
 
-    plt.xlabel("Array Size (n)", fontsize=12)
-    plt.ylabel("Sorting Time (milliseconds)", fontsize=12)
-    plt.grid(True, linestyle="--", alpha=0.7)
-    plt.legend(fontsize=10)
+    _finish_complexity_axes(ax)
+
 
-    # Save the complexity analysis plot
-    complexity_filename = f"benchmark_plots/{base_filename}_complexity.png"
-    plt.tight_layout()
-    plt.savefig(complexity_filename, dpi=300)
-    plt.close()
+def _finish_complexity_axes(ax):
+    """Apply the shared labels, grid and legend of the complexity plot."""
+    ax.set_xlabel("Array Size (n)", fontsize=12)
+    ax.set_ylabel("Sorting Time (milliseconds)", fontsize=12)
+    ax.grid(True, linestyle="--", alpha=0.7)
+    ax.legend(fontsize=10)
+
+
+def _plot_one(benchmark_file, separate_figures, image_format):
+    """Pool worker: render one file, returning only the plot paths.
+
+    Keeps the parsed column arrays out of the result so they are not
+    pickled back to the parent process. Rejected inputs are reported as
+    None instead of letting SystemExit kill the worker mid-task, which
+    would leave the parent blocked in starmap forever.
+    """
+    try:
+        return visualize_benchmark(benchmark_file, separate_figures, image_format)[0]
+    except SystemExit:
+        return None
 
 
 def main():
-    # Find the latest benchmark file or use provided file
-    if len(sys.argv) > 1:
-        benchmark_file = sys.argv[1]
+    parser = argparse.ArgumentParser(
+        description="Visualize heapsort benchmark results."
+    )
+    parser.add_argument(
+        "benchmark_files",
+        nargs="*",
+        help="benchmark CSVs to plot (defaults to the latest in benchmark_results/)",
+    )
+    parser.add_argument(
+        "--glob",
+        metavar="PATTERN",
+        help="also plot every benchmark CSV matching this glob pattern",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="DIR",
+        help="render every benchmark file in DIR sequentially in this "
+        "process, amortizing interpreter and import startup",
+    )
+    parser.add_argument(
+        "--separate-figures",
+        action="store_true",
+        help="write one image per plot instead of a single combined grid",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("png", "svg"),
+        default="png",
+        help="output image format (svg skips rasterization entirely)",
+    )
+    args = parser.parse_args()
+
+    # Collect the requested files, or fall back to the latest benchmark
+    benchmark_files = list(args.benchmark_files)
+    if args.glob:
+        benchmark_files.extend(sorted(glob.glob(args.glob)))
+    if args.batch:
+        try:
+            with os.scandir(args.batch) as entries:
+                benchmark_files.extend(
+                    sorted(
+                        entry.path
+                        for entry in entries
+                        if entry.name.endswith(_BENCHMARK_EXTENSIONS)
+                        and entry.is_file()
+                    )
+                )
+        except OSError as e:
+            print(f"Cannot read batch directory: {e}")
+            sys.exit(1)
+    for benchmark_file in benchmark_files:
         if not os.path.exists(benchmark_file):
             print(f"Benchmark file not found: {benchmark_file}")
             sys.exit(1)
+    if not benchmark_files:
+        # An explicit selection that matched nothing is an error; the
+        # latest-file fallback is only for running with no arguments.
+        if args.batch:
+            print(f"No benchmark files in {args.batch}")
+            sys.exit(1)
+        if args.glob:
+            print(f"No benchmark files match {args.glob}")
+            sys.exit(1)
+        benchmark_files = [find_latest_benchmark()]
+
+    # Create visualizations. Multiple files fan out over a process pool,
+    # except in --batch mode, which stays in this one warm process so the
+    # already-paid import cost is amortized over the whole directory.
+    failed_files = []
+    if len(benchmark_files) == 1 or args.batch:
+        data = None
+        plot_files = []
+        for benchmark_file in benchmark_files:
+            # Same failure semantics as the pool path: a rejected file is
+            # recorded and the rest of the directory still renders.
+            try:
+                files, data = visualize_benchmark(
+                    benchmark_file, args.separate_figures, args.format
+                )
+            except SystemExit:
+                failed_files.append(benchmark_file)
+                continue
+            plot_files.extend(files)
     else:
-        benchmark_file = find_latest_benchmark()
+        import multiprocessing
 
-    # Create visualizations
-    plot_files = visualize_benchmark(benchmark_file)
+        workers = min(len(benchmark_files), os.cpu_count() or 1)
+        with multiprocessing.Pool(workers, maxtasksperchild=10) as pool:
+            results = pool.starmap(
+                _plot_one,
+                [(f, args.separate_figures, args.format) for f in benchmark_files],
+            )
+        failed_files = [
+            f for f, result in zip(benchmark_files, results) if result is None
+        ]
+        plot_files = [f for result in results if result is not None for f in result]
 
     print(f"\nBenchmark visualization complete!")
     print(f"The following visualization files were created:")
     for plot_file in plot_files:
         print(f"- {plot_file}")
 
-    # Additional summary of the benchmark data
+    # Why each rejected file failed was already printed as it happened;
+    # exit non-zero only after every file has had its chance to render.
+    if failed_files:
+        print(f"\nFailed to visualize: {', '.join(failed_files)}")
+        sys.exit(1)
+
+    if len(benchmark_files) > 1:
+        return
+
+    # Additional summary of the benchmark data, reusing the columns that
+    # visualize_benchmark already parsed where possible
     try:
-        df = pd.read_csv(benchmark_file)
-        min_size = df["Size"].min()
-        max_size = df["Size"].max()
-        avg_time_ms = df["Time (ms)"].mean()
-        max_time_ms = df["Time (ms)"].max()
+        if data is None:
+            data = _filter_valid(load_benchmark_data(benchmark_files[0]))
+        min_size = data["Size"].min()
+        max_size = data["Size"].max()
+        avg_time_ms = data["Time (ms)"].mean()
+        max_time_ms = data["Time (ms)"].max()
 
         print(f"\nBenchmark Summary:")
         print(f"- Array sizes: {min_size} to {max_size}")
         print(f"- Average sorting time: {avg_time_ms:.2f} ms")
         print(f"- Maximum sorting time: {max_time_ms:.2f} ms")
-        print(f"- Data points: {len(df)}")
+        print(f"- Data points: {len(data['Size'])}")
 
     except Exception as e:
         print(f"Error generating summary: {e}")